@@ -1,19 +1,41 @@
 import os
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Optional
 
 import pandas as pd
 import streamlit as st
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Text, Date, DateTime, ForeignKey, select, func
+    create_engine, event, insert, update, delete, Column, Integer, String, Text, Date, DateTime, ForeignKey, select, func, or_, text
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
-from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker, selectinload, Session
+from sqlalchemy.exc import OperationalError
 
 # --------------------------- Config ---------------------------
 DEFAULT_DB = "sqlite:///regtracker.db"
 DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_DB)
-engine = create_engine(DATABASE_URL, echo=False, future=True)
+
+@st.cache_resource
+def get_engine(url: str = DATABASE_URL):
+    """One engine (and connection pool) per process, shared across sessions."""
+    connect_args = {}
+    if url.startswith("sqlite"):
+        # Streamlit may serve sessions from different threads
+        connect_args["check_same_thread"] = False
+    eng = create_engine(url, echo=False, future=True, pool_pre_ping=True, connect_args=connect_args)
+    if eng.dialect.name == "sqlite":
+        @event.listens_for(eng, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            # WAL: readers don't block the writer; NORMAL: one fsync per
+            # checkpoint instead of two per commit
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.close()
+    return eng
+
+engine = get_engine()
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 Base = declarative_base()
 
@@ -22,13 +44,18 @@ class Regulation(Base):
     __tablename__ = "regulations"
     id = Column(Integer, primary_key=True)
     title = Column(Text, nullable=False)
-    source = Column(String)
+    source = Column(String, index=True)
     jurisdiction = Column(String)
-    category = Column(String)
+    category = Column(String, index=True)
     effective_date = Column(Date)
-    received_at = Column(DateTime, default=datetime.utcnow)
+    received_at = Column(DateTime, server_default=func.now())
     summary = Column(Text)
-    status = Column(String, default="Open")  # Open | In Progress | Closed
+    status = Column(String, default="Open", index=True)  # Open | In Progress | Closed
+    # lowercased copies of the searchable fields, maintained on write so the
+    # LIKE fallback never calls lower() per row
+    title_lc = Column(Text, index=True)
+    summary_lc = Column(Text, index=True)
+    jurisdiction_lc = Column(Text, index=True)
 
     links = relationship("RegulationLink", back_populates="regulation", cascade="all, delete-orphan")
     actions = relationship("Action", back_populates="regulation", cascade="all, delete-orphan")
@@ -51,20 +78,114 @@ class Action(Base):
     description = Column(Text)
     status = Column(String, default="Planned")  # Planned | In Progress | Done | Blocked
     assignee = Column(String)
-    due_date = Column(Date)
+    due_date = Column(Date, index=True)
     completed_at = Column(DateTime)
 
     regulation = relationship("Regulation", back_populates="actions")
 
+REG_STATUSES = ("Open", "In Progress", "Closed")
+REG_STATUS_IDX = {status: i for i, status in enumerate(REG_STATUSES)}
+ACTION_STATUSES = ("Planned", "In Progress", "Done", "Blocked")
+
+@event.listens_for(Regulation, "before_insert")
+@event.listens_for(Regulation, "before_update")
+def _set_lowercase_columns(mapper, connection, target):
+    target.title_lc = (target.title or "").lower()
+    target.summary_lc = (target.summary or "").lower()
+    target.jurisdiction_lc = (target.jurisdiction or "").lower()
+
 # --------------------------- DB init & seed ---------------------------
 Base.metadata.create_all(engine)
 
+def upgrade_schema():
+    """Bring a pre-existing SQLite DB up to the current models.
+
+    create_all skips tables that already exist, so columns and indexes added
+    after a DB file was first created never land there. Add the *_lc search
+    columns (with a one-time backfill) and any missing indexes.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as conn:
+        cols = {r[1] for r in conn.execute(text("PRAGMA table_info(regulations)"))}
+        missing = [c for c in ("title_lc", "summary_lc", "jurisdiction_lc") if c not in cols]
+        for c in missing:
+            conn.execute(text(f"ALTER TABLE regulations ADD COLUMN {c} TEXT"))
+        if missing:
+            conn.execute(text(
+                "UPDATE regulations SET title_lc = lower(title), "
+                "summary_lc = lower(summary), jurisdiction_lc = lower(jurisdiction)"
+            ))
+        # indexes added after the first release; no-ops on fresh DBs
+        for ddl in (
+            "CREATE INDEX IF NOT EXISTS ix_regulations_source ON regulations (source)",
+            "CREATE INDEX IF NOT EXISTS ix_regulations_category ON regulations (category)",
+            "CREATE INDEX IF NOT EXISTS ix_regulations_status ON regulations (status)",
+            "CREATE INDEX IF NOT EXISTS ix_regulations_title_lc ON regulations (title_lc)",
+            "CREATE INDEX IF NOT EXISTS ix_regulations_summary_lc ON regulations (summary_lc)",
+            "CREATE INDEX IF NOT EXISTS ix_regulations_jurisdiction_lc ON regulations (jurisdiction_lc)",
+            "CREATE INDEX IF NOT EXISTS ix_actions_due_date ON actions (due_date)",
+        ):
+            conn.execute(text(ddl))
+
+upgrade_schema()
+
+# Full-text search over title/summary/jurisdiction via an external-content
+# FTS5 table kept in sync with `regulations` by triggers.
+_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS regulations_fts USING fts5(
+        title, summary, jurisdiction,
+        content='regulations', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2')""",
+    """CREATE TRIGGER IF NOT EXISTS regulations_fts_ai AFTER INSERT ON regulations BEGIN
+        INSERT INTO regulations_fts(rowid, title, summary, jurisdiction)
+        VALUES (new.id, new.title, new.summary, new.jurisdiction);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS regulations_fts_ad AFTER DELETE ON regulations BEGIN
+        INSERT INTO regulations_fts(regulations_fts, rowid, title, summary, jurisdiction)
+        VALUES ('delete', old.id, old.title, old.summary, old.jurisdiction);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS regulations_fts_au AFTER UPDATE ON regulations BEGIN
+        INSERT INTO regulations_fts(regulations_fts, rowid, title, summary, jurisdiction)
+        VALUES ('delete', old.id, old.title, old.summary, old.jurisdiction);
+        INSERT INTO regulations_fts(rowid, title, summary, jurisdiction)
+        VALUES (new.id, new.title, new.summary, new.jurisdiction);
+    END""",
+]
+
+def init_fts() -> bool:
+    if engine.dialect.name != "sqlite":
+        return False
+    try:
+        with engine.begin() as conn:
+            fresh = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type='table' AND name='regulations_fts'")
+            ).first() is None
+            for ddl in _FTS_DDL:
+                conn.execute(text(ddl))
+            if fresh:
+                # index rows that predate the FTS table; only on first creation,
+                # not on every rerun of the script
+                conn.execute(text("INSERT INTO regulations_fts(regulations_fts) VALUES ('rebuild')"))
+        return True
+    except OperationalError:
+        # SQLite built without FTS5; search falls back to LIKE
+        return False
+
+FTS_ENABLED = init_fts()
+
+def _fts_prefix_query(ql: str) -> str:
+    """Quote each token so user input can't break MATCH syntax; prefix-match the last."""
+    tokens = ['"{}"'.format(t.replace('"', '""')) for t in ql.split()]
+    if tokens:
+        tokens[-1] += "*"
+    return " ".join(tokens)
+
 def seed_if_empty():
-    with SessionLocal() as s:
-        exists = s.execute(select(func.count(Regulation.id))).scalar_one()
-        if exists:
-            return
-        r1 = Regulation(
+    # plain dicts + core inserts: one transaction, one executemany per table,
+    # no per-object unit-of-work bookkeeping
+    regs = [
+        dict(
             id=1,
             title="EU MRV 2025 Amendments",
             source="EU",
@@ -74,16 +195,8 @@ def seed_if_empty():
             received_at=datetime(2025,7,15,10,0,0),
             summary="Revised monitoring & reporting for CO₂ and CH₄.",
             status="In Progress",
-        )
-        r1.links = [
-            RegulationLink(url="https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32025R-MRV", link_type="official", title="EUR-Lex: MRV 2025"),
-            RegulationLink(url="https://example.com/mrv-guide.pdf", link_type="guidance", title="Practical MRV Guide (PDF)"),
-        ]
-        r1.actions = [
-            Action(title="Update data pipeline for CH₄", description="Include methane reporting in MRV extracts", status="In Progress", assignee="A. Smith", due_date=date(2025,8,20)),
-            Action(title="Crew circular MRV changes", description="Ops circular outlining new monitoring plan", status="Planned", assignee="M. Lopez", due_date=date(2025,8,25)),
-        ]
-        r2 = Regulation(
+        ),
+        dict(
             id=2,
             title="IMO MARPOL Annex VI NOx Tier III Guidance",
             source="IMO",
@@ -93,10 +206,8 @@ def seed_if_empty():
             received_at=datetime(2025,7,20,9,0,0),
             summary="Clarifies EIAPP documentation and testing windows for retrofits.",
             status="Open",
-        )
-        r2.links = [RegulationLink(url="https://www.imo.org/en/OurWork/Environment/Pages/Air-Pollution.aspx", link_type="official", title="IMO Air Pollution")]
-        r2.actions = [Action(title="Assess retrofit feasibility", description="Check Tier III compliance options for 2012-2016 builds", status="Planned", assignee="J. Kim", due_date=date(2025,9,10))]
-        r3 = Regulation(
+        ),
+        dict(
             id=3,
             title="USCG Policy Letter 25-04 on E-Navigation Logs",
             source="USCG",
@@ -106,14 +217,165 @@ def seed_if_empty():
             received_at=datetime(2025,7,25,12,30,0),
             summary="Accepts specific e-nav log formats with integrity checks.",
             status="Open",
+        ),
+    ]
+    links = [
+        dict(regulation_id=1, url="https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32025R-MRV", link_type="official", title="EUR-Lex: MRV 2025"),
+        dict(regulation_id=1, url="https://example.com/mrv-guide.pdf", link_type="guidance", title="Practical MRV Guide (PDF)"),
+        dict(regulation_id=2, url="https://www.imo.org/en/OurWork/Environment/Pages/Air-Pollution.aspx", link_type="official", title="IMO Air Pollution"),
+        dict(regulation_id=3, url="https://www.dco.uscg.mil/Portals/9/CG-ENG/Policy", link_type="official", title="USCG Policy Portal"),
+    ]
+    actions = [
+        dict(regulation_id=1, title="Update data pipeline for CH₄", description="Include methane reporting in MRV extracts", status="In Progress", assignee="A. Smith", due_date=date(2025,8,20)),
+        dict(regulation_id=1, title="Crew circular MRV changes", description="Ops circular outlining new monitoring plan", status="Planned", assignee="M. Lopez", due_date=date(2025,8,25)),
+        dict(regulation_id=2, title="Assess retrofit feasibility", description="Check Tier III compliance options for 2012-2016 builds", status="Planned", assignee="J. Kim", due_date=date(2025,9,10)),
+    ]
+    # core inserts bypass the ORM events, so fill the *_lc columns here
+    for r in regs:
+        r.update(
+            title_lc=(r.get("title") or "").lower(),
+            summary_lc=(r.get("summary") or "").lower(),
+            jurisdiction_lc=(r.get("jurisdiction") or "").lower(),
         )
-        r3.links = [RegulationLink(url="https://www.dco.uscg.mil/Portals/9/CG-ENG/Policy", link_type="official", title="USCG Policy Portal")]
-
-        s.add_all([r1, r2, r3])
-        s.commit()
+    with engine.begin() as conn:
+        if conn.execute(select(func.count(Regulation.id))).scalar_one():
+            return
+        conn.execute(insert(Regulation), regs)
+        conn.execute(insert(RegulationLink), links)
+        conn.execute(insert(Action), actions)
 
 seed_if_empty()
 
+def _apply_action_edits(s: Session, regulation_id: int, original: pd.DataFrame, edited: pd.DataFrame) -> int:
+    """Diff the edited actions grid against the original; write only the changes.
+
+    Returns the number of rows inserted, updated or deleted.
+    """
+    def _row_values(row):
+        # Done and Status are NaN/None for editor-added rows whose cells were
+        # never touched (and NaN is truthy); required=True only flags the UI
+        done = bool(row.Done) if pd.notna(row.Done) else False
+        status = row.Status if pd.notna(row.Status) else "Planned"
+        final_status = "Done" if done else status
+        return dict(
+            title=row.Title or "New action",
+            description=row.Description or "",
+            status=final_status,
+            assignee=row.Assignee or "",
+            due_date=None if pd.isna(row.Due) else row.Due,
+        )
+
+    changed = 0
+    original_by_id = {int(r.ID): _row_values(r) for r in original.itertuples(index=False)}
+    seen = set()
+    for row in edited.itertuples(index=False):
+        values = _row_values(row)
+        if pd.isna(row.ID):
+            # row added in the editor
+            s.execute(
+                insert(Action).values(
+                    regulation_id=regulation_id,
+                    completed_at=func.now() if values["status"] == "Done" else None,
+                    **values,
+                )
+            )
+            changed += 1
+            continue
+        action_id = int(row.ID)
+        seen.add(action_id)
+        if values != original_by_id.get(action_id):
+            s.execute(
+                update(Action)
+                .where(Action.id == action_id)
+                .values(completed_at=func.now() if values["status"] == "Done" else None, **values)
+            )
+            changed += 1
+    for action_id in original_by_id.keys() - seen:
+        # row removed in the editor
+        s.execute(delete(Action).where(Action.id == action_id))
+        changed += 1
+    return changed
+
+# --------------------------- Cached queries ---------------------------
+@st.cache_data(ttl=60)
+def load_regulations(ql: str = "", source: str = "All", status: str = "All", category: str = "All") -> pd.DataFrame:
+    """Filtered regulation list as a plain DataFrame (no ORM objects).
+
+    Filtering happens in SQL so unmatched rows are never fetched; the cache
+    is keyed by the filter arguments.
+    """
+    # a whitespace-only search has no tokens and would make MATCH choke on
+    # an empty query string
+    ql = ql.strip()
+    # only the six displayed columns; summary (and everything else) is
+    # fetched just for the selected regulation in the details pane
+    stmt = select(
+        Regulation.id, Regulation.title, Regulation.source,
+        Regulation.category, Regulation.effective_date, Regulation.status,
+    )
+    # cheap, selective equality predicates first; the text search term last
+    if source != "All":
+        stmt = stmt.where(Regulation.source == source)
+    if status != "All":
+        stmt = stmt.where(Regulation.status == status)
+    if category != "All":
+        stmt = stmt.where(Regulation.category == category)
+    if ql:
+        if FTS_ENABLED:
+            stmt = stmt.where(
+                text("regulations.id IN (SELECT rowid FROM regulations_fts WHERE regulations_fts MATCH :fts_q)")
+            ).params(fts_q=_fts_prefix_query(ql))
+        else:
+            pattern = f"%{ql}%"
+            stmt = stmt.where(or_(
+                Regulation.title_lc.like(pattern),
+                Regulation.summary_lc.like(pattern),
+                Regulation.jurisdiction_lc.like(pattern),
+            ))
+    with SessionLocal() as s:
+        rows = s.execute(stmt).all()
+    df = pd.DataFrame.from_records(
+        rows,
+        columns=["ID", "Title", "Source", "Category", "Effective", "Status"],
+    )
+    # low-cardinality columns as int-coded categories; keeps the frame small
+    # and cheap to Arrow-serialize once the table grows
+    for c in ("Source", "Category", "Status"):
+        df[c] = df[c].astype("category")
+    df["ID"] = df["ID"].astype("int32")
+    return df
+
+@st.cache_data(ttl=300)
+def filter_options() -> tuple:
+    """Distinct sources and categories for the sidebar, from one query."""
+    with SessionLocal() as s:
+        rows = s.execute(select(Regulation.source, Regulation.category)).all()
+    sources = sorted({r[0] for r in rows if r[0]})
+    categories = sorted({r[1] for r in rows if r[1]})
+    return sources, categories
+
+def invalidate_caches():
+    """Drop cached query results after any write so the next rerun refetches."""
+    load_regulations.clear()
+    filter_options.clear()
+
+MAX_LIST_ROWS = 500
+
+def display_dataframe_quickly(df: pd.DataFrame, max_rows: int = MAX_LIST_ROWS) -> pd.DataFrame:
+    """Render at most max_rows rows at a time and return the visible slice.
+
+    Bounds Arrow serialization and browser DOM size to the page size instead
+    of the full filtered table.
+    """
+    if len(df) <= max_rows:
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        return df
+    start = st.slider("Start row", 0, len(df) - max_rows, 0, step=max_rows)
+    page = df.iloc[start:start + max_rows]
+    st.dataframe(page, use_container_width=True, hide_index=True)
+    st.caption(f"Showing rows {start}–{start + len(page)} of {len(df)}")
+    return page
+
 # --------------------------- UI ---------------------------
 st.set_page_config(page_title="Regulation Tracker (PoC)", layout="wide")
 st.title("Regulation Tracker")
@@ -121,135 +383,118 @@ st.title("Regulation Tracker")
 with st.sidebar:
     st.subheader("Filters")
     q = st.text_input("Search (title/summary/jurisdiction)")
-    # dynamic options
-    with SessionLocal() as s:
-        sources = [r[0] for r in s.execute(select(Regulation.source).distinct()).all() if r[0]]
-        categories = [r[0] for r in s.execute(select(Regulation.category).distinct()).all() if r[0]]
+    sources, categories = filter_options()
     source = st.selectbox("Source", options=["All"] + sources)
-    status = st.selectbox("Status", options=["All", "Open", "In Progress", "Closed"])
+    status = st.selectbox("Status", options=["All"] + list(REG_STATUSES))
     category = st.selectbox("Category", options=["All"] + categories)
 
-# fetch filtered list
-with SessionLocal() as s:
-    stmt = select(Regulation)
-    regs = s.execute(stmt).scalars().all()
-
-# client-side filter for simplicity
-filtered: List[Regulation] = []
+# filters are pushed down into the SQL WHERE clause
 ql = (q or "").lower()
-for r in regs:
-    if ql:
-        if not ((r.title or "").lower().find(ql) >= 0 or (r.summary or "").lower().find(ql) >= 0 or (r.jurisdiction or "").lower().find(ql) >= 0):
-            continue
-    if source != "All" and r.source != source:
-        continue
-    if status != "All" and r.status != status:
-        continue
-    if category != "All" and r.category != category:
-        continue
-    filtered.append(r)
+filtered = load_regulations(ql, source, status, category)
 
 left, right = st.columns([7,5])
 
 with left:
     st.subheader("Regulations")
-    df = pd.DataFrame([
-        {
-            "ID": r.id,
-            "Title": r.title,
-            "Source": r.source,
-            "Category": r.category,
-            "Effective": r.effective_date,
-            "Status": r.status,
-        }
-        for r in filtered
-    ])
-    st.dataframe(df, use_container_width=True, hide_index=True)
-
-    ids = [r.id for r in filtered]
-    titles = [f"#{r.id} — {r.title[:80]}" for r in filtered]
-    selected_label = st.selectbox("Select a regulation", options=["(none)"] + titles)
-    selected_id: Optional[int] = None
-    if selected_label != "(none)":
-        idx = titles.index(selected_label)
-        selected_id = ids[idx]
+    visible = display_dataframe_quickly(filtered)
 
-with right:
+    # the selection widget only offers the visible page; options carry the ID
+    # directly so no label lookup is needed
+    vis_regs = filtered.loc[visible.index]
+    titles_by_id = {int(i): f"#{i} — {t[:80]}" for i, t in zip(vis_regs["ID"], vis_regs["Title"])}
+    selected_id: Optional[int] = st.selectbox(
+        "Select a regulation",
+        options=[None] + list(titles_by_id),
+        format_func=lambda i: "(none)" if i is None else titles_by_id[i],
+    )
+
+@st.fragment
+def details_pane(selected_id: Optional[int]):
+    """Right-hand detail/edit UI; its widgets rerun only this fragment."""
     st.subheader("Details & Actions")
     if not selected_id:
         st.info("Select a regulation on the left to view and edit.")
-    else:
-        with SessionLocal() as s:
-            reg = s.get(Regulation, selected_id)
-            if not reg:
-                st.error("Not found.")
-            else:
-                st.markdown(f"### {reg.title}")
-                st.caption(f"{reg.source or '-'} · {reg.jurisdiction or '-'} · Effective {reg.effective_date or '-'}")
-                st.write(reg.summary or "")
-
-                # edit status
-                new_status = st.selectbox("Status", options=["Open", "In Progress", "Closed"], index=["Open","In Progress","Closed"].index(reg.status or "Open"))
-                if new_status != reg.status:
-                    reg.status = new_status
-                    s.add(reg)
-                    s.commit()
-                    st.success("Status updated")
-
-                st.markdown("#### Relevant Links")
-                if not reg.links:
-                    st.write("No links attached.")
-                else:
-                    for l in reg.links:
-                        st.markdown(f"- [{l.title or l.url}]({l.url})  ")
-
-                st.markdown("#### Actions")
-                # list actions
-                if not reg.actions:
-                    st.write("No actions yet.")
-                else:
-                    for a in sorted(reg.actions, key=lambda x: (x.due_date or date.max)):
-                        with st.expander(f"{a.title} — {a.status}"):
-                            c1,c2,c3 = st.columns([2,1,1])
-                            with c1:
-                                new_title = st.text_input("Title", value=a.title, key=f"t_{a.id}")
-                                new_desc = st.text_area("Description", value=a.description or "", key=f"d_{a.id}")
-                            with c2:
-                                new_status = st.selectbox("Status", ["Planned","In Progress","Done","Blocked"], index=["Planned","In Progress","Done","Blocked"].index(a.status or "Planned"), key=f"s_{a.id}")
-                                new_assignee = st.text_input("Assignee", value=a.assignee or "", key=f"as_{a.id}")
-                            with c3:
-                                new_due = st.date_input("Due date", value=a.due_date or date.today(), key=f"dd_{a.id}")
-                                done = st.checkbox("Mark done", value=(a.status=="Done"), key=f"ck_{a.id}")
-                            save = st.button("Save", key=f"save_{a.id}")
-                            delete = st.button("Delete", type="secondary", key=f"del_{a.id}")
-                            if save:
-                                a.title = new_title
-                                a.description = new_desc
-                                a.status = "Done" if done else new_status
-                                a.assignee = new_assignee
-                                a.due_date = new_due
-                                a.completed_at = datetime.utcnow() if a.status=="Done" else None
-                                s.add(a)
-                                s.commit()
-                                st.success("Saved")
-                            if delete:
-                                s.delete(a)
-                                s.commit()
-                                st.warning("Deleted")
-
-                st.divider()
-                st.markdown("#### Add Action")
-                with st.form("add_action"):
-                    atitle = st.text_input("Title", value="New action")
-                    adesc = st.text_area("Description", value="")
-                    aassignee = st.text_input("Assignee", value="")
-                    adue = st.date_input("Due date", value=date.today())
-                    submitted = st.form_submit_button("Add")
-                    if submitted:
-                        new_a = Action(regulation_id=reg.id, title=atitle, description=adesc, assignee=aassignee, due_date=adue)
-                        s.add(new_a)
-                        s.commit()
-                        st.success("Action added")
+        return
+    with SessionLocal() as s:
+        # one batched IN-query per relationship instead of lazy loads
+        reg = s.execute(
+            select(Regulation)
+            .where(Regulation.id == selected_id)
+            .options(selectinload(Regulation.links))
+        ).scalar_one_or_none()
+        if not reg:
+            st.error("Not found.")
+            return
+        st.markdown(f"### {reg.title}")
+        st.caption(f"{reg.source or '-'} · {reg.jurisdiction or '-'} · Effective {reg.effective_date or '-'}")
+        st.write(reg.summary or "")
+
+        # edit status
+        new_status = st.selectbox("Status", options=list(REG_STATUSES), index=REG_STATUS_IDX.get(reg.status, 0))
+        if new_status != reg.status:
+            # targeted UPDATE; no unit-of-work flush or dirty-attribute diff
+            s.execute(update(Regulation).where(Regulation.id == reg.id).values(status=new_status))
+            s.commit()
+            invalidate_caches()
+            st.success("Status updated")
+            # the list in the left column shows this status; leave the
+            # fragment scope so it refreshes too
+            st.rerun(scope="app")
+
+        st.markdown("#### Relevant Links")
+        if not reg.links:
+            st.write("No links attached.")
+        else:
+            for l in reg.links:
+                st.markdown(f"- [{l.title or l.url}]({l.url})  ")
+
+        st.markdown("#### Actions")
+        # list actions, ordered by the due_date index
+        actions = s.execute(
+            select(Action)
+            .where(Action.regulation_id == reg.id)
+            .order_by(Action.due_date.asc().nullslast())
+        ).scalars().all()
+        actions_df = pd.DataFrame(
+            [
+                {
+                    "ID": a.id,
+                    "Title": a.title,
+                    "Description": a.description or "",
+                    "Status": a.status or "Planned",
+                    "Assignee": a.assignee or "",
+                    "Due": a.due_date,
+                    "Done": a.status == "Done",
+                }
+                for a in actions
+            ],
+            columns=["ID", "Title", "Description", "Status", "Assignee", "Due", "Done"],
+        )
+        # one grid component instead of 6 widgets per action; edits come back
+        # as a DataFrame to diff against the original
+        edited = st.data_editor(
+            actions_df,
+            num_rows="dynamic",
+            use_container_width=True,
+            hide_index=True,
+            disabled=["ID"],
+            column_config={
+                "Status": st.column_config.SelectboxColumn("Status", options=list(ACTION_STATUSES), required=True),
+                "Due": st.column_config.DateColumn("Due"),
+                "Done": st.column_config.CheckboxColumn("Done"),
+            },
+            key=f"actions_editor_{reg.id}",
+        )
+        if st.button("Save actions"):
+            changed = _apply_action_edits(s, reg.id, actions_df, edited)
+            s.commit()
+            invalidate_caches()
+            st.success(f"Saved {changed} change(s)" if changed else "Nothing to save")
+            if changed:
+                st.rerun(scope="app")
+
+with right:
+    details_pane(selected_id)
 
 
 st.caption("DB: {}".format(DATABASE_URL))